@@ -0,0 +1,17 @@
+#!/bin/sh
+# Cross-compile the driver to .mpy bytecode files. Copying the .mpy
+# files to the device instead of the .py sources makes imports faster
+# and lowers the compile-time memory requirements, which is useful
+# on memory constrained devices like the ESP8266.
+#
+# Any extra argument is passed to mpy-cross: most notably you can
+# use -march=<arch> (xtensa, xtensawin, armv6m, armv7m, ...) so that
+# the @micropython.viper / @micropython.native decorated functions
+# are emitted as native code for your target MCU.
+#
+# Example:
+#     ./make_mpy.sh -march=armv6m     # Raspberry Pico
+#     mpremote cp st7789_base.mpy st7789_ext.mpy :
+mpy-cross -O2 "$@" st7789_base.py || exit 1
+mpy-cross -O2 "$@" st7789_ext.py || exit 1
+echo "Done. Copy the files with: mpremote cp st7789_base.mpy st7789_ext.mpy :"
@@ -0,0 +1,9 @@
+# MicroPython board manifest to freeze the driver into the firmware.
+# Include it from your board manifest with:
+#
+#     include("/path/to/ST77xx-pure-MP/manifest.py")
+#
+# Frozen modules live in flash as precompiled bytecode, so importing
+# the driver costs no RAM and no compile time at all.
+module("st7789_base.py")
+module("st7789_ext.py")
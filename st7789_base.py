@@ -46,12 +46,11 @@ ColorMode_16bit = const(0x05)
 ColorMode_18bit = const(0x06)
 ColorMode_16M = const(0x07)
 
-# Struct pack formats for pixel/pos encoding
-_ENCODE_PIXEL = ">H"
+# Struct pack format for position encoding
 _ENCODE_POS = ">HH"
 
 class ST7789_base:
-    def __init__(self, spi, width, height, reset, dc, cs=None):
+    def __init__(self, spi, width, height, reset, dc, cs=None, spi_chunk=None):
         """
         display = st7789.ST7789(
             SPI(1, baudrate=40000000, phase=0, polarity=1),
@@ -68,6 +67,13 @@ class ST7789_base:
         self.dc = dc
         self.cs = cs
 
+        # Maximum size of a single SPI data write, or None to ship
+        # whole payloads with one call. The optimum is port and board
+        # dependent: some SPI peripherals sustain better throughput
+        # when large transfers are split in DMA-friendly chunks
+        # (16384 is a good starting point to benchmark).
+        self.spi_chunk = spi_chunk
+
         # Always allocate a tiny 8x8 framebuffer in RGB565 for fast
         # single chars plotting. This is useful in order to draw text
         # using the framebuffer 8x8 font inside micropython and using
@@ -75,21 +81,102 @@ class ST7789_base:
         self.charfb_data = bytearray(8*8*2)
         self.charfb = framebuf.FrameBuffer(self.charfb_data,8,8,framebuf.RGB565)
 
+        # Scratch buffer used by char() when a character is clipped
+        # at the right edge of the screen: preallocated once instead
+        # of a fresh bytearray per clipped character.
+        self._char_partial = bytearray(8*8*2)
+        self._char_partial_mv = memoryview(self._char_partial)
+
+        # Rendered glyphs cache: (char,fg,bg) -> 8x8 RGB565 blit.
+        # Steady state UIs redraw the same few characters over and
+        # over (labels, digits of readings, ...), so caching the
+        # rasterized form skips the framebuffer work entirely. At
+        # most 64 entries (8k of RAM worst case), see char().
+        self._glyph_cache = {}
+
+        # Preallocated buffers for the CASET/RASET payloads written
+        # by pixel(). Encoding the position into these avoids two
+        # struct.pack() allocations for each pixel drawn: the garbage
+        # collector pressure is very important in the pixel drawing
+        # hot path.
+        self._caset_px = bytearray(4)
+        self._raset_px = bytearray(4)
+
+        # Shared span buffer used by hline()/vline(): it is stamped
+        # with the last color used and reused as long as the color
+        # does not change, so drawing lines (and the shapes built on
+        # top of them) does not allocate a fresh buffer per call.
+        self._line_buf = bytearray(max(width,height)*2)
+        self._line_mv = memoryview(self._line_buf)
+        self._line_color = None
+
+        # fill() scratch buffer, cached together with the color it
+        # was built for: repeated fills with the same color (like
+        # clearing the screen at every frame) reuse it as is.
+        self._fill_buf = None
+        self._fill_color = None
+
+        # Strip buffer used by text() to render a whole string and
+        # transfer it with a single SPI data write. Lazily allocated
+        # and grow-only, so steady-state text drawing (status lines,
+        # labels, ...) does not allocate.
+        self._text_buf = None
+
+        # Last CASET/RASET ranges issued, so the window setting
+        # methods can skip redundant commands: shapes like filled
+        # circles and rectangles reuse the same columns range for
+        # many consecutive lines. Kept as four plain integers (-1 =
+        # invalid) to avoid allocating tuples in the hot path.
+        self._last_col_s = -1
+        self._last_col_e = -1
+        self._last_row_s = -1
+        self._last_row_e = -1
+
+        # Dirty bounding box [x0,y0,x1,y1] accumulated via dirty(),
+        # or None when the whole screen should be transferred. Set
+        # here so dirty() works (as a no-op accumulation) even if
+        # called before enable_framebuffer().
+        self._dirty = None
+
+        # Shared buffer for _encode_pos(). The encoded payload is
+        # always consumed by an SPI write before the next call, so a
+        # single buffer is enough to make window changes allocation
+        # free.
+        self._pos_buf = bytearray(4)
+
+        # Cache bound methods used in the hot paths. In MicroPython
+        # each self.dc.off walks two attributes at every call, and
+        # drawing primitives may do it thousands of times per frame.
+        self._dc_on = dc.on
+        self._dc_off = dc.off
+        self._spi_write = spi.write
+        self._write = self.write
+
     # That's the color format our API takes. We take r, g, b, translate
     # to 16 bit value and pack it as as two bytes.
     def color(self, r=0, g=0, b=0):
-        # Convert red, green and blue values (0-255) into a 16-bit 565 encoding.
-        c = (r & 0xf8) << 8 | (g & 0xfc) << 3 | b >> 3
-        return struct.pack(_ENCODE_PIXEL, c)
+        # Convert red, green and blue values (0-255) into a 16-bit 565
+        # encoding, big endian as the display wants it on the wire.
+        return bytes(((r & 0xf8) | (g >> 5),
+                      ((g & 0x1c) << 3) | (b >> 3)))
 
     def write(self, command=None, data=None):
         """SPI write to the device: commands and data"""
         if command is not None:
-            self.dc.off()
-            self.spi.write(command)
+            self._dc_off()
+            self._spi_write(command)
         if data is not None:
-            self.dc.on()
-            if len(data): self.spi.write(data)
+            self._dc_on()
+            if len(data): self._spi_write(data)
+
+    # Both reset flavors restore the controller default window, so
+    # the last CASET/RASET ranges we remember no longer match the
+    # chip state and must be forgotten.
+    def _invalidate_window_cache(self):
+        self._last_col_s = -1
+        self._last_col_e = -1
+        self._last_row_s = -1
+        self._last_row_e = -1
 
     def hard_reset(self):
         if self.reset:
@@ -99,10 +186,12 @@ class ST7789_base:
             time.sleep_ms(50)
             self.reset.on()
             time.sleep_ms(150)
+        self._invalidate_window_cache()
 
     def soft_reset(self):
         self.write(ST77XX_SWRESET)
         time.sleep_ms(150)
+        self._invalidate_window_cache()
 
     def sleep_mode(self, value):
         if value:
@@ -173,83 +262,185 @@ class ST7789_base:
         self.write(ST7789_MADCTL, bytes([value]))
 
     def _encode_pos(self, x, y):
-        """Encode a postion into bytes."""
-        return struct.pack(_ENCODE_POS, x, y)
-
-    def _set_columns(self, start, end):
-        self.write(ST77XX_CASET, self._encode_pos(start+self.xstart, end+self.xstart))
-
-    def _set_rows(self, start, end):
-        self.write(ST77XX_RASET, self._encode_pos(start+self.ystart, end+self.ystart))
+        """Encode a postion into the preallocated buffer."""
+        struct.pack_into(_ENCODE_POS, self._pos_buf, 0, x, y)
+        return self._pos_buf
 
     # Set the video memory windows that will be receive our
     # SPI data writes. Note that this function assumes that
     # x0 <= x1 and y0 <= y1.
+    #
+    # This is the prologue of every drawing primitive, so the three
+    # command phases are fused here using the cached bound methods
+    # instead of going through the write() dispatch. CASET/RASET are
+    # skipped when the ranges match the last ones issued.
     def set_window(self, x0, y0, x1, y1):
-        self._set_columns(x0, x1)
-        self._set_rows(y0, y1)
-        self.write(ST77XX_RAMWR)
+        dc_on = self._dc_on
+        dc_off = self._dc_off
+        spi_write = self._spi_write
+
+        if x0 != self._last_col_s or x1 != self._last_col_e:
+            self._last_col_s = x0
+            self._last_col_e = x1
+            dc_off()
+            spi_write(ST77XX_CASET)
+            dc_on()
+            spi_write(self._encode_pos(x0+self.xstart, x1+self.xstart))
+
+        if y0 != self._last_row_s or y1 != self._last_row_e:
+            self._last_row_s = y0
+            self._last_row_e = y1
+            dc_off()
+            spi_write(ST77XX_RASET)
+            dc_on()
+            spi_write(self._encode_pos(y0+self.ystart, y1+self.ystart))
+
+        # RAMWR is needed every time: it also resets the write
+        # pointer to the start of the window.
+        dc_off()
+        spi_write(ST77XX_RAMWR)
+        dc_on()
+
+    # Patch a preallocated 4 bytes buffer with the same position
+    # repeated twice in the big endian encoding CASET/RASET expect.
+    # Thanks to the Viper emitter this is much faster than calling
+    # struct.pack(), and allocates nothing.
+    @micropython.viper
+    def _encode_px_pos(self, pos: int, buf: ptr8):
+        buf[0] = pos >> 8
+        buf[1] = pos & 0xff
+        buf[2] = pos >> 8
+        buf[3] = pos & 0xff
+
+    # Bounds-checked pixel drawing: pixels outside the display area
+    # are silently discarded. Callers that already clipped their
+    # coordinates can use pixel_unchecked() directly and skip the
+    # comparisons (and this extra call) for each pixel.
+    def pixel(self,x,y,color):
+        if x < 0 or x >= self.width or y < 0 or y >= self.height: return
+        self.pixel_unchecked(x,y,color)
 
     # Drawing raw pixels is a fundamental operation so we go low
     # level avoiding function calls. This and other optimizations
     # made drawing 10k pixels with an ESP2866 from 420ms to 100ms.
-    def pixel(self,x,y,color):
-        if x < 0 or x >= self.width or y < 0 or y >= self.height: return
-        self.dc.off()
-        self.spi.write(ST77XX_CASET)
-        self.dc.on()
-        self.spi.write(self._encode_pos(x+self.xstart, x+self.xstart))
-
-        self.dc.off()
-        self.spi.write(ST77XX_RASET)
-        self.dc.on()
-        self.spi.write(self._encode_pos(y+self.ystart*2, y+self.ystart*2))
-
-        self.dc.off()
-        self.spi.write(ST77XX_RAMWR)
-        self.dc.on()
-        self.spi.write(color)
+    def pixel_unchecked(self,x,y,color):
+        dc_on = self._dc_on
+        dc_off = self._dc_off
+        spi_write = self._spi_write
+
+        # We set the window directly, so the last-window cache used
+        # by set_window() is no longer valid.
+        self._last_col_s = -1
+        self._last_row_s = -1
+
+        self._encode_px_pos(x+self.xstart, self._caset_px)
+        dc_off()
+        spi_write(ST77XX_CASET)
+        dc_on()
+        spi_write(self._caset_px)
+
+        self._encode_px_pos(y+self.ystart, self._raset_px)
+        dc_off()
+        spi_write(ST77XX_RASET)
+        dc_on()
+        spi_write(self._raset_px)
+
+        dc_off()
+        spi_write(ST77XX_RAMWR)
+        dc_on()
+        spi_write(color)
+
+    # Draw many pixels of the same color. 'points' is a list of
+    # (x,y) tuples. The points are sorted in scanline order so that
+    # horizontally adjacent pixels are grouped into runs: each run
+    # costs a single window setup instead of one CASET/RASET/RAMWR
+    # sequence per pixel, amortizing the command overhead.
+    def pixels(self, points, color):
+        points = sorted(points, key=lambda p: (p[1], p[0]))
+        hline = self.hline
+        run_x = run_y = 0
+        run_len = 0
+        for x, y in points:
+            if run_len and y == run_y and x < run_x+run_len:
+                continue # Duplicated point.
+            if run_len and y == run_y and x == run_x+run_len:
+                run_len += 1
+                continue
+            if run_len:
+                hline(run_x, run_x+run_len-1, run_y, color)
+            run_x, run_y, run_len = x, y, 1
+        if run_len:
+            hline(run_x, run_x+run_len-1, run_y, color)
 
     # Just fill the whole display memory with the specified color.
-    # We use a buffer of screen-width pixels. Even in the worst case
-    # of 320 pixels, it's just 640 bytes. Note that writing a scanline
-    # per loop dramatically improves performances.
+    # We write as many rows as fit in a 4k buffer per SPI transaction:
+    # a single transfer of the whole screen would be faster yet, but
+    # would require a full framebuffer worth of memory, against the
+    # goals of this driver. Even so, this performs a dozen writes in
+    # place of one per row.
     def fill(self,color):
         self.set_window(0, 0, self.width-1, self.height-1)
-        buf = color*self.width
-        for i in range(self.height): self.write(None, buf)
+        # Size the row buffer according to the configured SPI chunk
+        # when the user tuned one, with a 4k default, never exceeding
+        # a full screen worth of data.
+        target = self.spi_chunk if self.spi_chunk else 4096
+        nrows = min(max(1, target // (self.width*2)), self.height)
+        if (self._fill_buf == None or color != self._fill_color or
+            len(self._fill_buf) != self.width*nrows*2):
+            self._fill_buf = color*(self.width*nrows)
+            self._fill_color = color
+        buf = self._fill_buf
+        full, rem = divmod(self.height, nrows)
+        write = self._write
+        for i in range(full): write(None, buf)
+        if rem: write(None, memoryview(buf)[:self.width*rem*2])
 
     # Draw a full or empty rectangle.
     # x,y are the top-left corner coordinates.
     # w and h are width/height in pixels.
     def rect(self,x,y,w,h,color,fill=False):
         if fill:
-            self.set_window(x,y,x+w-1,y+1-w)
-            if w*h > 256:
-                buf = color*w
-                for i in range(h): self.write(None, buf)
+            self.set_window(x,y,x+w-1,y+h-1)
+            if w*2 <= len(self._line_buf):
+                # Reuse the shared span buffer as row: no allocation
+                # needed, one SPI write per row.
+                if color != self._line_color: self._stamp_line(color)
+                row = self._line_mv[:w*2]
             else:
-                buf = color*(w*h)
-                self.write(None, buf)
+                row = color*w
+            write = self._write
+            for i in range(h): write(None, row)
         else:
             self.hline(x,x+w-1,y,color)
             self.hline(x,x+w-1,y+h-1,color)
             self.vline(y,y+h-1,x,color)
             self.vline(y,y+h-1,x+w-1,color)
 
+    # Stamp the shared span buffer with the specified color. Only
+    # called when the color is different from the one the buffer
+    # already contains.
+    def _stamp_line(self, color):
+        self._line_buf[:] = color*(len(self._line_buf)//2)
+        self._line_color = color
+
     # We can draw horizontal and vertical lines very fast because
     # we can just set a 1 pixel wide/tall window and fill it.
     def hline(self,x0,x1,y,color):
         if y < 0 or y >= self.height: return
         x0,x1 = max(min(x0,x1),0),min(max(x0,x1),self.width-1)
+        if x0 > x1: return # Fully out of the display area.
         self.set_window(x0, y, x1, y)
-        self.write(None, color*(x1-x0+1))
+        if color != self._line_color: self._stamp_line(color)
+        self.write(None, self._line_mv[:(x1-x0+1)*2])
 
     # Same as hline() but for vertical lines.
     def vline(self,y0,y1,x,color):
+        if x < 0 or x >= self.width: return
         y0,y1 = max(min(y0,y1),0),min(max(y0,y1),self.height-1)
+        if y0 > y1: return # Fully out of the display area.
         self.set_window(x, y0, x, y1)
-        self.write(None, color*(y1-y0+1))
+        if color != self._line_color: self._stamp_line(color)
+        self.write(None, self._line_mv[:(y1-y0+1)*2])
 
     # Draw a single character 'char' using the font in the MicroPython
     # framebuffer implementation. It is possible to specify the background and
@@ -262,30 +453,73 @@ class ST7789_base:
         if x >= self.width or y >= self.height:
             return # Totally out of display area
 
-        # Obtain the character representation in our
-        # 8x8 framebuffer.
-        self.charfb.fill(bgcolor[1]<<8|bgcolor[0])
-        self.charfb.text(char,0,0,fgcolor[1]<<8|fgcolor[0])
+        key = (char,fgcolor,bgcolor)
+        glyph = self._glyph_cache.get(key)
+        if glyph == None:
+            # Obtain the character representation in our
+            # 8x8 framebuffer.
+            self.charfb.fill(bgcolor[1]<<8|bgcolor[0])
+            self.charfb.text(char,0,0,fgcolor[1]<<8|fgcolor[0])
+            glyph = bytes(self.charfb_data)
+            # Simple eviction policy: when the cache is full, drop
+            # everything. MicroPython dicts don't remember insertion
+            # order, so real LRU/FIFO would cost more than it saves.
+            if len(self._glyph_cache) >= 64:
+                self._glyph_cache.clear()
+            self._glyph_cache[key] = glyph
 
         if x+7 >= self.width:
             # Right side of char does not fit on the screen.
             # Partial update.
             width = self.width-x # Visible width pixels
             self.set_window(x, y, x+width-1, y+7)
-            copy = bytearray(width*8*2)
+            copy = self._char_partial
             for dy in range(8):
                 src_idx = (dy*8)*2
                 dst_idx = (dy*width)*2
-                copy[dst_idx:dst_idx+width*2] = self.charfb_data[src_idx:src_idx+width*2]
-            self.write(None,copy)
+                copy[dst_idx:dst_idx+width*2] = glyph[src_idx:src_idx+width*2]
+            self.write(None,self._char_partial_mv[:width*8*2])
         else:
             self.set_window(x, y, x+7, y+7)
-            self.write(None,self.charfb_data)
+            self.write(None,glyph)
 
-    # Write text. Like 'char' but for full strings.
+    # Write text. Like 'char' but for full strings. The whole string
+    # is rendered in a single strip framebuffer and transferred with
+    # one window setup and one data write, instead of paying three
+    # window commands for every character.
     def text(self,x,y,txt,fgcolor,bgcolor):
-        for i in range(len(txt)):
-            self.char(x+i*8,y,txt[i],fgcolor,bgcolor)
+        if len(txt) == 0 or x >= self.width or y >= self.height:
+            return
+        strip_w = len(txt)*8
+        size = strip_w*8*2
+        if self._text_buf is None or len(self._text_buf) < size:
+            self._text_buf = bytearray(size)
+        fb = framebuf.FrameBuffer(self._text_buf,strip_w,8,framebuf.RGB565)
+        fb.fill(bgcolor[1]<<8|bgcolor[0])
+        fb.text(txt,0,0,fgcolor[1]<<8|fgcolor[0])
+
+        # Clip the strip against both horizontal edges: xofs is how
+        # many columns are lost at the left, visible how many remain
+        # on screen.
+        xofs = 0
+        if x < 0:
+            xofs = -x
+            x = 0
+        visible = min(strip_w-xofs, self.width-x)
+        if visible <= 0: return
+
+        mv = memoryview(self._text_buf)
+        if visible == strip_w:
+            self.set_window(x, y, x+strip_w-1, y+7)
+            self.write(None, mv[:size])
+        else:
+            # Part of the string does not fit on the screen. Set a
+            # window of the visible columns and stream each row of
+            # the strip: RAMWR data accumulates across writes.
+            self.set_window(x, y, x+visible-1, y+7)
+            for dy in range(8):
+                start = (dy*strip_w+xofs)*2
+                self.write(None, mv[start:start+visible*2])
 
     # Turn on framebuffer. You can write to it directly addressing
     # the fb instance like in:
@@ -293,18 +527,78 @@ class ST7789_base:
     # display.fb.fill(display.fb_color(100,50,50))
     # display.show()
     def enable_framebuffer(self,mono=False):
+        # Argument buffer for fb_line(): viper functions take at
+        # most four arguments, so the line endpoints and color are
+        # packed here as 16 bit words.
+        self._fb_line_args = bytearray(10)
         if mono == False:
             self.fbformat = framebuf.RGB565
             self.rawbuffer = bytearray(self.width*self.height*2)
+            # Cached memoryview of the framebuffer, so the chunked
+            # show path can slice it without copies.
+            self._fb_mv = memoryview(self.rawbuffer)
             self.show = self.show_rgb
         else:
             self.fbformat = framebuf.MONO_HMSB
             self.rawbuffer = bytearray((self.width*self.height+7)//8)
+            # Preallocated RGB565 buffers used by the mono
+            # framebuffer transfer, each holding several rows (about
+            # 2k per buffer): writing multiple rows per SPI
+            # transaction amortizes the per-write overhead, without
+            # allocating a full RGB565 frame that would defeat the
+            # memory savings of mono mode. The row count is rounded
+            # down to a divisor of the height so every transfer is a
+            # whole buffer. Two buffers are used in alternation, see
+            # fast_mono_to_rgb().
+            rows = max(1, 2048 // (self.width*2))
+            while self.height % rows: rows -= 1
+            self.mono_rows_per_write = rows
+            self.mono_row = bytearray(self.width*2*rows)
+            self.mono_row2 = bytearray(self.width*2*rows)
+            # Flat lookup table mapping each possible framebuffer
+            # byte to the 16 bytes of the eight RGB565 pixels it
+            # encodes. A flat bytearray costs 4k of RAM but can be
+            # addressed with viper pointers, so the expansion in
+            # fast_mono_to_rgb() copies whole entries instead of
+            # recomputing the row bit by bit at every show().
+            self.mono_lut = bytearray(256*16)
+            for b in range(256):
+                base = b*16
+                for i in range(8):
+                    if (b >> i) & 1:
+                        self.mono_lut[base+i*2] = 0xff
+                        self.mono_lut[base+i*2+1] = 0xff
             self.show = self.show_mono
 
         self.fb = framebuf.FrameBuffer(self.rawbuffer,
             self.width,self.height,self.fbformat)
 
+        # Forget any region declared dirty before this point: the
+        # fresh framebuffer starts with a full-screen show() anyway.
+        self._dirty = None
+
+    # Declare a region of the framebuffer as modified, so that the
+    # next show() call transfers only the dirty bounding box instead
+    # of the whole screen. Tracking is opt-in because drawing happens
+    # directly on the framebuf instance (display.fb.*), where the
+    # driver can't observe what changed: call this after drawing if
+    # you want partial updates. Without any declared region, show()
+    # keeps updating the full screen.
+    def dirty(self,x,y,w,h):
+        x1 = min(x+w-1, self.width-1)
+        y1 = min(y+h-1, self.height-1)
+        x = max(x,0)
+        y = max(y,0)
+        if x > x1 or y > y1: return
+        d = self._dirty
+        if d == None:
+            self._dirty = [x,y,x1,y1]
+        else:
+            if x < d[0]: d[0] = x
+            if y < d[1]: d[1] = y
+            if x1 > d[2]: d[2] = x1
+            if y1 > d[3]: d[3] = y1
+
     # This function is used to conver an RGB value to the
     # equivalent color for the framebuffer functions.
     def fb_color(self,r,g,b):
@@ -312,9 +606,40 @@ class ST7789_base:
         return c[1]<<8 | c[0]
 
     # Transfer the framebuffer image into the display. RGB565 mode.
+    # set_window() leaves DC in data mode, so we can push the raw
+    # buffer with direct SPI writes, skipping the write() dispatch.
     def show_rgb(self):
+        d = self._dirty
+        if d != None:
+            self._dirty = None
+            return self.show_rgb_rect(d[0],d[1],d[2],d[3])
         self.set_window(0,0,self.width-1,self.height-1)
-        self.write(None, self.rawbuffer)
+        chunk = self.spi_chunk
+        if chunk == None or len(self.rawbuffer) <= chunk:
+            self._spi_write(self.rawbuffer)
+        else:
+            mv = self._fb_mv
+            spi_write = self._spi_write
+            for off in range(0, len(self.rawbuffer), chunk):
+                spi_write(mv[off:off+chunk])
+
+    # Transfer only the specified rectangle (inclusive coordinates)
+    # of the RGB565 framebuffer. Full-width rectangles are contiguous
+    # in memory and go out as a single write; otherwise we pay one
+    # write per row, still far less data than the whole screen.
+    def show_rgb_rect(self,x0,y0,x1,y1):
+        self.set_window(x0,y0,x1,y1)
+        mv = self._fb_mv
+        w2 = self.width*2
+        if x0 == 0 and x1 == self.width-1:
+            self._spi_write(mv[y0*w2:(y1+1)*w2])
+            return
+        spi_write = self._spi_write
+        start = y0*w2 + x0*2
+        n = (x1-x0+1)*2
+        for y in range(y0,y1+1):
+            spi_write(mv[start:start+n])
+            start += w2
 
     # This function uses the Viper native code emitter with a speedup
     # of 20x or alike. It converts rows of 1 bit pixels into a rows
@@ -322,21 +647,150 @@ class ST7789_base:
     # memory. On a Raspberry Pico this takes about ~60ms.
     @micropython.viper
     def fast_mono_to_rgb(self, fb8: ptr8, width: int, height: int):
-        # Just allocate one row worth of buffer.
-        row = bytearray(int(self.width)*2)
-        dst = ptr16(row)
-        bit = int(0)
-        for y in range(height):
-            for x in range(width):
-                byte = bit//8
-                color = 0xffff * ((fb8[byte] >> (bit&7)) & 1)
-                dst[x] = color
-                bit += 1
-            # Each row is written in a single SPI call.
-            self.write(None, row)
+        # Expand into the two preallocated row buffers, alternating
+        # between them: on ports where SPI.write() returns as soon as
+        # the tail of the payload is queued in the hardware FIFO, the
+        # conversion of the next row overlaps with the transmission
+        # of the previous one.
+        row_a = self.mono_row
+        row_b = self.mono_row2
+        rows = int(self.mono_rows_per_write)
+        ngroups = height // rows
+        if width & 7 == 0:
+            # Fast path for widths multiple of eight: each input byte
+            # maps to exactly 16 output bytes precomputed in the
+            # mono_lut table, copied with four 32 bit stores.
+            l32 = ptr32(self.mono_lut)
+            group = (width >> 3) * rows
+            idx = int(0)
+            for g in range(ngroups):
+                if g & 1:
+                    row = row_b
+                else:
+                    row = row_a
+                d32 = ptr32(row)
+                for i in range(group):
+                    sb = fb8[idx]
+                    idx += 1
+                    w = i << 2
+                    # All-black and all-white source bytes dominate
+                    # in typical frames (large flat regions): store
+                    # the constant directly, skipping the LUT loads.
+                    if sb == 0:
+                        d32[w] = 0
+                        d32[w+1] = 0
+                        d32[w+2] = 0
+                        d32[w+3] = 0
+                    elif sb == 0xff:
+                        d32[w] = -1
+                        d32[w+1] = -1
+                        d32[w+2] = -1
+                        d32[w+3] = -1
+                    else:
+                        e = sb << 2
+                        d32[w] = l32[e]
+                        d32[w+1] = l32[e+1]
+                        d32[w+2] = l32[e+2]
+                        d32[w+3] = l32[e+3]
+                # Each group of rows is written in a single SPI call.
+                self.write(None, row)
+        else:
+            # General path: expand the frame bit by bit. The packed
+            # bits are continuous across rows, so the group buffers
+            # are filled with no regard for row boundaries.
+            bit = int(0)
+            group_px = rows*width
+            for g in range(ngroups):
+                if g & 1:
+                    row = row_b
+                else:
+                    row = row_a
+                dst = ptr16(row)
+                for x in range(group_px):
+                    byte = bit//8
+                    color = 0xffff * ((fb8[byte] >> (bit&7)) & 1)
+                    dst[x] = color
+                    bit += 1
+                self.write(None, row)
 
     # Transfer the framebuffer image into the display. 1 bit mode, so
     # this requires a conversion while transferring data.
+    #
+    # When a dirty region was declared, only its rows are expanded
+    # and written: mono pixels are bit packed, so the region is
+    # widened to full rows aligned to the rows-per-write grouping of
+    # the expander. Widths that are not a multiple of eight fall back
+    # to a full update, as their rows don't align to byte boundaries.
     def show_mono(self):
-        self.set_window(0,0,self.width-1,self.height-1)
-        self.fast_mono_to_rgb(self.rawbuffer,self.width,self.height)
+        d = self._dirty
+        if d != None: self._dirty = None
+        if d == None or self.width & 7:
+            self.set_window(0,0,self.width-1,self.height-1)
+            self.fast_mono_to_rgb(self.rawbuffer,self.width,self.height)
+            return
+        rows = self.mono_rows_per_write
+        y0 = (d[1]//rows)*rows
+        y1 = (d[3]//rows)*rows + rows-1
+        self.set_window(0,y0,self.width-1,y1)
+        start = (y0*self.width)//8
+        self.fast_mono_to_rgb(memoryview(self.rawbuffer)[start:],
+            self.width, y1-y0+1)
+
+    # Draw a line directly into the enabled framebuffer. A dedicated
+    # viper Bresenham writing the raw buffer via typed pointers skips
+    # the per-pixel framebuf dispatch. Like image(), in order to be
+    # fast this method can't do bounds checking: the caller must pass
+    # coordinates inside the framebuffer. The color is an integer as
+    # returned by fb_color() (or 0/1 in mono mode).
+    def fb_line(self, x0, y0, x1, y1, color):
+        struct.pack_into("<HHHHH", self._fb_line_args, 0,
+            x0, y0, x1, y1, color)
+        mono = 1 if self.fbformat == framebuf.MONO_HMSB else 0
+        self._fb_line(self._fb_line_args, self.width, mono)
+
+    @micropython.viper
+    def _fb_line(self, args: ptr16, width: int, mono: int):
+        buf = ptr8(self.rawbuffer)
+        buf16 = ptr16(self.rawbuffer)
+        x0 = args[0]
+        y0 = args[1]
+        x1 = args[2]
+        y1 = args[3]
+        color = args[4]
+
+        dx = x1 - x0
+        if dx < 0: dx = 0 - dx
+        dy = y1 - y0
+        if dy > 0: dy = 0 - dy
+        if x0 < x1:
+            sx = 1
+        else:
+            sx = -1
+        if y0 < y1:
+            sy = 1
+        else:
+            sy = -1
+        err = dx + dy
+
+        while True:
+            if mono:
+                # In MONO_HMSB format the leftmost pixel is the least
+                # significant bit of each byte.
+                idx = y0*width + x0
+                b = idx >> 3
+                if color:
+                    buf[b] = buf[b] | (1 << (idx & 7))
+                else:
+                    buf[b] = buf[b] & (0xff ^ (1 << (idx & 7)))
+            else:
+                buf16[y0*width + x0] = color
+            if x0 == x1:
+                if y0 == y1:
+                    break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
@@ -11,8 +11,10 @@ import st7789_base, framebuf, struct
 
 class ST7789(st7789_base.ST7789_base):
     # Bresenham's algorithm with fast path for horizontal / vertical lines.
-    # Note that accumulating partial successive small horizontal/vertical
-    # lines is actually slower than the vanilla pixel approach.
+    # Steps that advance only along the major axis are accumulated and
+    # flushed as a single hline()/vline() when the minor axis moves, so
+    # a nearly horizontal (or vertical) line costs a handful of window
+    # setups instead of a full one per pixel.
     def line(self, x0, y0, x1, y1, color):
         if y0 == y1: return self.hline(x0, x1, y0, color)
         if x0 == x1: return self.vline(y0, y1, x0, color)
@@ -23,31 +25,59 @@ class ST7789(st7789_base.ST7789_base):
         sy = 1 if y0 < y1 else -1
         err = dx + dy  # Error value for xy
 
-        while True:
-            self.pixel(x0, y0, color)
-            if x0 == x1 and y0 == y1: break
-            e2 = 2 * err
-            if e2 >= dy:
+        if dx >= -dy:
+            # Shallow line: x advances at every step, y from time to
+            # time. Emit one hline per y.
+            hline = self.hline
+            run_x = x0
+            while True:
+                if x0 == x1 and y0 == y1:
+                    hline(run_x, x0, y0, color)
+                    break
+                e2 = 2 * err
                 err += dy
-                x0 += sx
-            if e2 <= dx:
+                if e2 <= dx:
+                    # y moves: the run at this y is complete.
+                    hline(run_x, x0, y0, color)
+                    err += dx
+                    x0 += sx
+                    y0 += sy
+                    run_x = x0
+                else:
+                    x0 += sx
+        else:
+            # Steep line: the mirror case, one vline per x.
+            vline = self.vline
+            run_y = y0
+            while True:
+                if x0 == x1 and y0 == y1:
+                    vline(run_y, y0, x0, color)
+                    break
+                e2 = 2 * err
                 err += dx
-                y0 += sy
-
-    # Midpoint Circle algorithm for filled circle.
-    def circle(self, x, y, radius, color, fill=False):
+                if e2 >= dy:
+                    # x moves: the run at this x is complete.
+                    vline(run_y, y0, x0, color)
+                    err += dy
+                    y0 += sy
+                    x0 += sx
+                    run_y = y0
+                else:
+                    y0 += sy
+
+    # Compute the first octant of a circle of the given radius with
+    # the Midpoint algorithm. The (x,y) pairs are emitted into 'out'
+    # as 16 bit words, and the number of pairs is returned. Running
+    # the integer iteration under the viper emitter leaves to the
+    # Python level loop of circle() only the SPI dispatch.
+    @micropython.viper
+    def _circle_octant(self, radius: int, out: ptr16) -> int:
         f = 1 - radius
         dx = 1
-        dy = -2 * radius
+        dy = 0 - 2*radius
         x0 = 0
         y0 = radius
-
-        if fill:
-            self.hline(x - radius, x + radius, y, color) # Draw diameter
-        else:
-            self.pixel(x - radius, y, color) # Left-most point
-            self.pixel(x + radius, y, color) # Right-most point
-
+        n = 0
         while x0 < y0:
             if f >= 0:
                 y0 -= 1
@@ -56,53 +86,94 @@ class ST7789(st7789_base.ST7789_base):
             x0 += 1
             dx += 2
             f += dx
+            out[n] = x0
+            out[n+1] = y0
+            n += 2
+        return n >> 1
+
+    # Midpoint Circle algorithm for filled circle.
+    def circle(self, x, y, radius, color, fill=False):
+        if fill:
+            # Scanline fill: one hline per row, with the half-width
+            # updated incrementally walking down from the center.
+            # Unlike mirroring the octant points, this never draws a
+            # row twice and costs 2r+1 window setups in total.
+            hline = self.hline
+            r2 = radius*radius
+            hw = radius
+            for dy in range(radius+1):
+                while hw > 0 and hw*hw + dy*dy > r2: hw -= 1
+                hline(x - hw, x + hw, y + dy, color)
+                if dy: hline(x - hw, x + hw, y - dy, color)
+            return
 
-            if fill:
-				# We can exploit our relatively fast horizontal line
-				# here, and just draw an h line for each two points at
-				# the extremes.
-                self.hline(x - x0, x + x0, y + y0, color) # Upper half
-                self.hline(x - x0, x + x0, y - y0, color) # Lower half
-                self.hline(x - y0, x + y0, y + x0, color) # Right half
-                self.hline(x - y0, x + y0, y - x0, color) # Left half
-            else:
-				# Plot points in each of the eight octants
-				self.pixel(x + x0, y + y0, color)
-				self.pixel(x - x0, y + y0, color)
-				self.pixel(x + x0, y - y0, color)
-				self.pixel(x - x0, y - y0, color)
-				self.pixel(x + y0, y + x0, color)
-				self.pixel(x - y0, y + x0, color)
-				self.pixel(x + y0, y - x0, color)
-				self.pixel(x - y0, y - x0, color)
-
-	# This function draws a filled triangle: it is an
-	# helper of .triangle when the fill flag is true.
+        self.pixel(x - radius, y, color) # Left-most point
+        self.pixel(x + radius, y, color) # Right-most point
+        if radius <= 0: return
+
+        # The octant never has more than 'radius' points, each taking
+        # two 16 bit words, stored by viper in little endian.
+        points = bytearray(radius*4)
+        count = self._circle_octant(radius, points)
+
+        # Near the circle extremes the midpoint iteration produces
+        # stretches of points sharing the same slow coordinate: group
+        # them into runs and mirror each run in the eight octants as
+        # hlines (flat octants) and vlines (steep octants). One run
+        # costs 8 window setups instead of 8 per point.
+        hline = self.hline
+        vline = self.vline
+        i = 0
+        while i < count:
+            a = points[i*4] | (points[i*4+1] << 8)    # Run start, fast axis
+            ry = points[i*4+2] | (points[i*4+3] << 8) # Run slow coordinate
+            b = a
+            i += 1
+            while i < count and ry == (points[i*4+2] | (points[i*4+3] << 8)):
+                b = points[i*4] | (points[i*4+1] << 8)
+                i += 1
+            # Flat octants: runs along x.
+            hline(x + a, x + b, y + ry, color)
+            hline(x - a, x - b, y + ry, color)
+            hline(x + a, x + b, y - ry, color)
+            hline(x - a, x - b, y - ry, color)
+            # Steep octants (coordinates swapped): runs along y.
+            vline(y + a, y + b, x + ry, color)
+            vline(y + a, y + b, x - ry, color)
+            vline(y - a, y - b, x + ry, color)
+            vline(y - a, y - b, x - ry, color)
+
+    # This function draws a filled triangle: it is an
+    # helper of .triangle when the fill flag is true.
+    # The edges are walked with 16.16 fixed point increments:
+    # integer-only math avoids the MicroPython boxed floats, one
+    # allocation per operation in the scanline loop.
     def fill_triangle(self, x0, y0, x1, y1, x2, y2, color):
         # Vertex are required to be ordered by y.
         if y0 > y1: x0, y0, x1, y1 = x1, y1, x0, y0
         if y0 > y2: x0, y0, x2, y2 = x2, y2, x0, y0
         if y1 > y2: x1, y1, x2, y2 = x2, y2, x1, y1
 
-        # Calculate slopes.
-        inv_slope1 = (x1 - x0) / (y1 - y0) if y1 - y0 != 0 else 0
-        inv_slope2 = (x2 - x0) / (y2 - y0) if y2 - y0 != 0 else 0
-        inv_slope3 = (x2 - x1) / (y2 - y1) if y2 - y1 != 0 else 0
+        # Calculate slopes, in 16.16 fixed point.
+        inv_slope1 = ((x1 - x0) << 16) // (y1 - y0) if y1 - y0 != 0 else 0
+        inv_slope2 = ((x2 - x0) << 16) // (y2 - y0) if y2 - y0 != 0 else 0
+        inv_slope3 = ((x2 - x1) << 16) // (y2 - y1) if y2 - y1 != 0 else 0
 
-        x_start, x_end = x0, x0
+        x_start = x_end = x0 << 16
+        hline = self.hline
 
         # Fill upper part.
         for y in range(y0, y1 + 1):
-            self.hline(int(x_start), int(x_end), y, color)
+            hline(x_start >> 16, x_end >> 16, y, color)
             x_start += inv_slope1
             x_end += inv_slope2
 
         # Adjust for the middle segment.
-        x_start = x1
+        x_start = x1 << 16
 
         # Fill the lower part.
         for y in range(y1 + 1, y2 + 1):
-            self.hline(int(x_start), int(x_end), y, color)
+            hline(x_start >> 16, x_end >> 16, y, color)
             x_start += inv_slope3
             x_end += inv_slope2
 
@@ -123,13 +194,15 @@ class ST7789(st7789_base.ST7789_base):
         fb.text(char,0,0,fgcolor[1]<<8|fgcolor[0])
         charsize = 8*upscaling
         if bgcolor: self.rect(x,y,charsize,charsize,bgcolor,fill=True)
+        rect = self.rect
+        pixel = self.pixel
         for py in range(8):
             for px in range(8):
                 if not (bitmap[py] & (1<<px)): continue # Background
                 if upscaling > 1:
-                    self.rect(x+px*upscaling,y+py*upscaling,upscaling,upscaling,fgcolor,fill=True)
+                    rect(x+px*upscaling,y+py*upscaling,upscaling,upscaling,fgcolor,fill=True)
                 else:
-                    self.pixel(x+px,y+py,fgcolor)
+                    pixel(x+px,y+py,fgcolor)
 
     def upscaled_text(self,x,y,txt,fgcolor,*,bgcolor=None,upscaling=2):
         for i in range(len(txt)):
@@ -147,9 +220,11 @@ class ST7789(st7789_base.ST7789_base):
         self.set_window(x,y,x+w-1,y+h-1)
         buf = bytearray(256)
         nocopy = memoryview(buf)
+        readinto = f.readinto
+        write = self.write
         while True:
-            nread = f.readinto(buf)
+            nread = readinto(buf)
             if nread == 0: return
-            self.write(None, nocopy[:nread])
+            write(None, nocopy[:nread])
 
 